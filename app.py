@@ -1,10 +1,19 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import sqlite3
+import threading
+import queue
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import json
 from typing import List, Dict, Tuple
 
+try:
+    import duckdb
+except ImportError:  # Optional: dashboard aggregates fall back to SQLite
+    duckdb = None
+
 # Configure page
 st.set_page_config(
     page_title="Resource Management System",
@@ -14,210 +23,407 @@ st.set_page_config(
 
 # Database setup
 DB_NAME = "resource_management.db"
+READ_POOL_SIZE = 4
+WORKDAY_HOURS = 9
 
-def init_database():
-    """Initialize SQLite database with required tables"""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    
-    # Create employees table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS employees (
-            emp_id TEXT PRIMARY KEY,
-            current_workload REAL DEFAULT 0,
-            next_free_time REAL DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Create tasks table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS tasks (
-            task_id TEXT PRIMARY KEY,
-            description TEXT NOT NULL,
-            duration REAL NOT NULL,
-            assigned_to TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (assigned_to) REFERENCES employees (emp_id)
-        )
-    ''')
-    
-    conn.commit()
-    conn.close()
+# Run once on every new connection: WAL lets readers proceed alongside the
+# single writer and synchronous=NORMAL is safe under WAL with fewer fsyncs
+CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+    PRAGMA foreign_keys=ON;
+"""
+
+# Created once per process when the write connection is bootstrapped
+SCHEMA_SQL = """
+    -- Employees table
+    CREATE TABLE IF NOT EXISTS employees (
+        emp_id TEXT PRIMARY KEY,
+        current_workload REAL DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ) WITHOUT ROWID;
+    
+    -- Tasks table
+    CREATE TABLE IF NOT EXISTS tasks (
+        task_id TEXT PRIMARY KEY,
+        description TEXT NOT NULL,
+        duration REAL NOT NULL,
+        assigned_to TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (assigned_to) REFERENCES employees (emp_id)
+    );
+    
+    -- Index the join/filter column and the listing sort order
+    CREATE INDEX IF NOT EXISTS idx_tasks_assigned_to ON tasks (assigned_to);
+    CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);
+"""
+
+# Queries are kept as module constants so every call hands sqlite3 the
+# same string and hits its per-connection statement cache
+_SQL_INSERT_EMP = "INSERT INTO employees (emp_id) VALUES (?)"
+_SQL_DELETE_EMP_TASKS = "DELETE FROM tasks WHERE assigned_to = ?"
+_SQL_DELETE_EMP = "DELETE FROM employees WHERE emp_id = ?"
+_SQL_ALL_EMPLOYEES = "SELECT emp_id, current_workload FROM employees"
+
+# Tasks are numbered after the rowid they are about to take; MAX(rowid) is a
+# single B-tree lookup and, unlike a row count, never hands out an ID that is
+# still in use after deletions
+_SQL_INSERT_TASK = '''
+    INSERT INTO tasks (task_id, description, duration, assigned_to) 
+    VALUES (printf('TASK_%03d', (SELECT COALESCE(MAX(rowid), 0) + 1 FROM tasks)), ?, ?, ?)
+'''
+_SQL_INSERT_TASK_RETURNING_ID = _SQL_INSERT_TASK + "RETURNING task_id"
+
+_SQL_ADD_WORKLOAD = '''
+    UPDATE employees 
+    SET current_workload = current_workload + ?
+    WHERE emp_id = ?
+    RETURNING current_workload
+'''
+
+# Takes a JSON array of [emp_id, duration] pairs and sums them per employee
+_SQL_ADD_WORKLOADS = '''
+    UPDATE employees 
+    SET current_workload = current_workload + d.total
+    FROM (
+        SELECT json_extract(value, '$[0]') AS emp_id,
+               SUM(json_extract(value, '$[1]')) AS total
+        FROM json_each(?)
+        GROUP BY 1
+    ) AS d
+    WHERE employees.emp_id = d.emp_id
+'''
+
+_SQL_ALL_TASKS = '''
+    SELECT task_id, description, duration, assigned_to, created_at 
+    FROM tasks ORDER BY created_at DESC
+'''
+
+# SQLite builds each employee's task list, so Python only decodes one JSON
+# array per employee
+_SQL_TASK_ASSIGNMENTS = '''
+    SELECT emp_id,
+           json_group_array(json_object(
+               'task_id', task_id,
+               'description', description,
+               'duration', duration,
+               'created_at', created_at
+           )) FILTER (WHERE task_id IS NOT NULL) AS tasks
+    FROM (
+        SELECT e.emp_id, t.task_id, t.description, t.duration, t.created_at
+        FROM employees e
+        LEFT JOIN tasks t ON e.emp_id = t.assigned_to
+        ORDER BY e.emp_id, t.created_at
+    )
+    GROUP BY emp_id
+'''
+
+# Plain SQL that also runs unchanged on DuckDB's view over the tasks table
+_SQL_TASK_COUNTS = '''
+    SELECT assigned_to, COUNT(*) FROM tasks
+    GROUP BY assigned_to
+    ORDER BY assigned_to
+'''
+
+# All four dashboard metrics in one round-trip
+_SQL_DASHBOARD_METRICS = '''
+    SELECT (SELECT COUNT(*) FROM employees) AS total_employees,
+           (SELECT COUNT(*) FROM tasks) AS total_tasks,
+           (SELECT COUNT(*) FROM employees WHERE current_workload < :hours) AS available_employees,
+           (SELECT COALESCE(SUM(duration), 0) FROM tasks) AS total_hours
+'''
+
+_SQL_DELETE_ALL_TASKS = "DELETE FROM tasks"
+_SQL_DELETE_ALL_EMPLOYEES = "DELETE FROM employees"
+
+# Least loaded employee who can fit the task today, otherwise whoever gets
+# free first; without completion times that is also the least loaded
+_SQL_BEST_EMPLOYEE = '''
+    SELECT emp_id FROM employees
+    ORDER BY
+        current_workload + :d > :hours,
+        current_workload,
+        emp_id
+    LIMIT 1
+'''
+
+def open_connection(db_name=DB_NAME) -> sqlite3.Connection:
+    """Open a connection shareable across threads, with PRAGMAs applied"""
+    conn = sqlite3.connect(db_name, check_same_thread=False, cached_statements=256)
+    conn.executescript(CONNECTION_PRAGMAS)
+    conn.row_factory = sqlite3.Row
+    return conn
 
 class DatabaseManager:
-    def __init__(self, db_name=DB_NAME):
+    def __init__(self, conn: sqlite3.Connection = None, db_name=DB_NAME, analytics=None):
         self.db_name = db_name
-    
-    def get_connection(self):
-        return sqlite3.connect(self.db_name)
+        # Optional DuckDB connection with read-only views over our tables
+        self._analytics = analytics
+        # One shared write connection, opened lazily if not given and
+        # serialized by the lock
+        self._lock = threading.Lock()
+        self._conn = conn
+        # Small pool of read connections handed out to whichever thread asks
+        self._readers = queue.Queue(maxsize=READ_POOL_SIZE)
+        # Bumped after every committed write; keys the cached reads below
+        self.version = 0
+    
+    @contextmanager
+    def _write(self):
+        """Run the block as one transaction on the shared write connection"""
+        with self._lock:
+            if self._conn is None:
+                self._conn = open_connection(self.db_name)
+            # Commits on success and rolls back on error; IMMEDIATE takes the
+            # write lock up front so the statements inside never have to
+            # upgrade it
+            with self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                yield self._conn
+            self.version += 1
+    
+    @contextmanager
+    def _read(self):
+        """Borrow a read connection from the pool"""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = open_connection(self.db_name)
+        try:
+            yield conn
+        finally:
+            try:
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
     
     def add_employee(self, emp_id: str) -> bool:
         """Add new employee to database"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("INSERT INTO employees (emp_id) VALUES (?)", (emp_id,))
-            conn.commit()
-            conn.close()
+            with self._write() as conn:
+                conn.execute(_SQL_INSERT_EMP, (emp_id,))
             return True
         except sqlite3.IntegrityError:
             return False
     
     def remove_employee(self, emp_id: str):
         """Remove employee and their tasks"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM tasks WHERE assigned_to = ?", (emp_id,))
-        cursor.execute("DELETE FROM employees WHERE emp_id = ?", (emp_id,))
-        conn.commit()
-        conn.close()
-    
-    def get_all_employees(self) -> List[Dict]:
+        with self._write() as conn:
+            conn.execute(_SQL_DELETE_EMP_TASKS, (emp_id,))
+            conn.execute(_SQL_DELETE_EMP, (emp_id,))
+    
+    def get_all_employees(self) -> pd.DataFrame:
         """Get all employees with their current workload"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT emp_id, current_workload, next_free_time FROM employees")
-        employees = []
-        for row in cursor.fetchall():
-            employees.append({
-                'emp_id': row[0],
-                'current_workload': row[1],
-                'next_free_time': row[2],
-                'available_hours': max(0, 9 - row[1]),
-                'is_available': row[1] < 9
-            })
-        conn.close()
-        return employees
-    
-    def add_task(self, task_id: str, description: str, duration: float, assigned_to: str):
-        """Add task and update employee workload"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Add task
-        cursor.execute('''
-            INSERT INTO tasks (task_id, description, duration, assigned_to) 
-            VALUES (?, ?, ?, ?)
-        ''', (task_id, description, duration, assigned_to))
-        
-        # Update employee workload
-        cursor.execute('''
-            UPDATE employees 
-            SET current_workload = current_workload + ?,
-                next_free_time = current_workload + ?
-            WHERE emp_id = ?
-        ''', (duration, duration, assigned_to))
-        
-        conn.commit()
-        conn.close()
+        with self._read() as conn:
+            df = pd.read_sql_query(_SQL_ALL_EMPLOYEES, conn)
+        return df.assign(
+            available_hours=(WORKDAY_HOURS - df['current_workload']).clip(lower=0),
+            is_available=df['current_workload'] < WORKDAY_HOURS
+        )
     
-    def get_all_tasks(self) -> List[Dict]:
+    def add_task(self, description: str, duration: float, assigned_to: str) -> Tuple[str, float]:
+        """Add task, update employee workload and return the task ID and new workload"""
+        with self._write() as conn:
+            # Add task
+            task_id = conn.execute(
+                _SQL_INSERT_TASK_RETURNING_ID, (description, duration, assigned_to)
+            ).fetchone()['task_id']
+            
+            # Update employee workload
+            workload = conn.execute(
+                _SQL_ADD_WORKLOAD, (duration, assigned_to)
+            ).fetchone()['current_workload']
+        return task_id, workload
+    
+    def add_tasks_bulk(self, tasks: List[Tuple[str, float, str]]):
+        """Add many (description, duration, assigned_to) tasks in one transaction"""
+        durations = json.dumps([[assigned_to, duration] for _, duration, assigned_to in tasks])
+        with self._write() as conn:
+            # Add tasks, numbered the same way as add_task
+            conn.executemany(_SQL_INSERT_TASK, tasks)
+            
+            # Update every affected employee's workload in one statement
+            conn.execute(_SQL_ADD_WORKLOADS, (durations,))
+    
+    def get_all_tasks(self) -> pd.DataFrame:
         """Get all tasks"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT task_id, description, duration, assigned_to, created_at 
-            FROM tasks ORDER BY created_at DESC
-        ''')
-        tasks = []
-        for row in cursor.fetchall():
-            tasks.append({
-                'task_id': row[0],
-                'description': row[1],
-                'duration': row[2],
-                'assigned_to': row[3],
-                'created_at': row[4]
-            })
-        conn.close()
-        return tasks
+        with self._read() as conn:
+            return pd.read_sql_query(_SQL_ALL_TASKS, conn)
     
     def get_task_assignments(self) -> Dict[str, List[Dict]]:
         """Get tasks grouped by employee"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT emp_id, task_id, description, duration, created_at
-            FROM employees e
-            LEFT JOIN tasks t ON e.emp_id = t.assigned_to
-            ORDER BY e.emp_id, t.created_at
-        ''')
-        
-        assignments = {}
-        for row in cursor.fetchall():
-            emp_id = row[0]
-            if emp_id not in assignments:
-                assignments[emp_id] = []
-            
-            if row[1]:  # If task exists
-                assignments[emp_id].append({
-                    'task_id': row[1],
-                    'description': row[2],
-                    'duration': row[3],
-                    'created_at': row[4]
-                })
-        
-        conn.close()
-        return assignments
+        with self._read() as conn:
+            rows = conn.execute(_SQL_TASK_ASSIGNMENTS).fetchall()
+        return {row['emp_id']: json.loads(row['tasks']) for row in rows}
+    
+    def get_task_counts_by_emp(self) -> Dict[str, int]:
+        """Get number of tasks per employee, skipping employees with none"""
+        if self._analytics is not None:
+            # A cursor is DuckDB's thread-safe handle onto a shared connection
+            cursor = self._analytics.cursor()
+            try:
+                rows = cursor.execute(_SQL_TASK_COUNTS).fetchall()
+            finally:
+                cursor.close()
+        else:
+            with self._read() as conn:
+                rows = conn.execute(_SQL_TASK_COUNTS).fetchall()
+        return dict(rows)
+    
+    def get_dashboard_metrics(self) -> Tuple[int, int, int, float]:
+        """Get employee, task and available-employee counts and total task hours"""
+        with self._read() as conn:
+            row = conn.execute(_SQL_DASHBOARD_METRICS, {'hours': WORKDAY_HOURS}).fetchone()
+        return row['total_employees'], row['total_tasks'], row['available_employees'], row['total_hours']
+    
+    def get_best_employee(self, duration: float) -> str:
+        """Get the employee a task of this duration should go to, or None"""
+        with self._read() as conn:
+            row = conn.execute(
+                _SQL_BEST_EMPLOYEE, {'d': duration, 'hours': WORKDAY_HOURS}
+            ).fetchone()
+        return row['emp_id'] if row else None
     
     def reset_all_data(self):
         """Reset all data in database"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM tasks")
-        cursor.execute("DELETE FROM employees")
-        conn.commit()
-        conn.close()
+        with self._write() as conn:
+            conn.execute(_SQL_DELETE_ALL_TASKS)
+            conn.execute(_SQL_DELETE_ALL_EMPLOYEES)
 
 class TaskScheduler:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
     
     def find_best_employee(self, task_duration: float) -> str:
+        return self.db_manager.get_best_employee(task_duration)
+    
+    def plan_assignments(self, task_durations: List[float]) -> List[str]:
+        """Assign tasks in order, as repeated find_best_employee calls would"""
         employees = self.db_manager.get_all_employees()
+        workload = dict(zip(employees['emp_id'], employees['current_workload']))
         
-        if not employees:
-            return None
-        
-        # First, try to find employees who can fit the task today
-        available_employees = []
-        for emp in employees:
-            if emp['available_hours'] >= task_duration:
-                available_employees.append((emp['current_workload'], emp['emp_id']))
-        
-        if available_employees:
-            # Sort by current workload (least loaded first)
-            available_employees.sort()
-            return available_employees[0][1]
-        
-        # If no one can fit it today, assign to who gets free first
-        next_free_times = [(emp['next_free_time'], emp['emp_id']) for emp in employees]
-        next_free_times.sort()
-        return next_free_times[0][1]
+        plan = []
+        for duration in task_durations:
+            if not workload:
+                return []
+            fits = [(load, emp_id) for emp_id, load in workload.items() if load + duration <= WORKDAY_HOURS]
+            if fits:
+                best_emp = min(fits)[1]
+            else:
+                best_emp = min((load, emp_id) for emp_id, load in workload.items())[1]
+            workload[best_emp] += duration
+            plan.append(best_emp)
+        return plan
+
+@st.cache_resource
+def bootstrap_db() -> sqlite3.Connection:
+    """Open the write connection and create the schema, once per process"""
+    conn = open_connection()
+    conn.executescript(SCHEMA_SQL)
+    return conn
+
+@st.cache_resource
+def get_analytics_db(db_name=DB_NAME):
+    """In-memory DuckDB reading the SQLite file, or None if unavailable"""
+    if duckdb is None:
+        return None
+    try:
+        # LOAD only, with auto-install off: fetching the extension would hit
+        # the network on every cold start, so it is a one-time deploy step
+        # (see README)
+        ddb = duckdb.connect(':memory:', config={'autoinstall_known_extensions': False})
+        ddb.execute("LOAD sqlite")
+        path = db_name.replace("'", "''")
+        ddb.execute(f"CREATE VIEW tasks AS SELECT * FROM sqlite_scan('{path}', 'tasks')")
+        return ddb
+    except duckdb.Error:
+        return None
+
+@st.cache_resource
+def get_db_manager() -> DatabaseManager:
+    """Shared DatabaseManager so its connections survive Streamlit reruns"""
+    # The schema has to exist before DuckDB binds its view over it
+    conn = bootstrap_db()
+    return DatabaseManager(conn, analytics=get_analytics_db())
 
-# Initialize database
-init_database()
-db_manager = DatabaseManager()
+@st.cache_resource
+def get_scheduler(_db: DatabaseManager) -> TaskScheduler:
+    """Shared TaskScheduler bound to the shared DatabaseManager"""
+    return TaskScheduler(_db)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_employees(_db: DatabaseManager, version: int) -> pd.DataFrame:
+    """Employees as of the given DB version"""
+    return _db.get_all_employees()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_assignments(_db: DatabaseManager, version: int) -> Dict[str, List[Dict]]:
+    """Tasks grouped by employee as of the given DB version"""
+    return _db.get_task_assignments()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_metrics(_db: DatabaseManager, version: int) -> Tuple[int, int, int, float]:
+    """Dashboard metrics as of the given DB version"""
+    return _db.get_dashboard_metrics()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _employees_df(_db: DatabaseManager, version: int) -> pd.DataFrame:
+    """Employee table as displayed, as of the given DB version"""
+    employees = _db.get_all_employees()
+    return pd.DataFrame({
+        "Employee ID": employees['emp_id'],
+        "Current Workload (hrs)": employees['current_workload'].map(f"{{:.1f}}/{WORKDAY_HOURS}".format),
+        "Available Hours": employees['available_hours'].map("{:.1f}".format),
+        "Status": np.where(employees['is_available'], "Available", "Fully Loaded")
+    })
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _tasks_df(_db: DatabaseManager, version: int) -> pd.DataFrame:
+    """Task table as displayed, as of the given DB version"""
+    tasks = _db.get_all_tasks()
+    desc = tasks['description']
+    return pd.DataFrame({
+        "Task ID": tasks['task_id'],
+        "Description": np.where(desc.str.len() > 50, desc.str[:50] + "...", desc),
+        "Duration (hrs)": tasks['duration'],
+        "Assigned To": tasks['assigned_to'],
+        "Created": tasks['created_at'].str[:16]  # Remove seconds
+    })
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_task_counts(_db: DatabaseManager, version: int) -> Dict[str, int]:
+    """Tasks per employee as of the given DB version"""
+    return _db.get_task_counts_by_emp()
 
 def main():
+    db_manager = get_db_manager()
+    
     st.title("🏢 Resource Management System")
     st.markdown("*Data is now persistently stored in SQLite database*")
     st.markdown("---")
     
+    # Confirmations are set right before st.rerun(), so show them on the
+    # run that follows
+    if "flash" in st.session_state:
+        st.success(st.session_state.pop("flash"))
+    
     # Sidebar for navigation
     st.sidebar.title("Navigation")
     tab = st.sidebar.radio("Select Section", ["Employee Management", "Task Management", "Dashboard", "Task Assignments"])
     
     if tab == "Employee Management":
-        employee_management()
+        employee_management(db_manager)
     elif tab == "Task Management":
-        task_management()
+        task_management(db_manager)
     elif tab == "Dashboard":
-        dashboard()
+        dashboard(db_manager)
     elif tab == "Task Assignments":
-        task_assignments()
+        task_assignments(db_manager)
 
-def employee_management():
+def employee_management(db_manager: DatabaseManager):
     st.header("👥 Employee Management")
     
     col1, col2 = st.columns([1, 2])
@@ -229,7 +435,7 @@ def employee_management():
         if st.button("Add Employee", type="primary"):
             if emp_id:
                 if db_manager.add_employee(emp_id):
-                    st.success(f"Employee {emp_id} added successfully!")
+                    st.session_state.flash = f"Employee {emp_id} added successfully!"
                     st.rerun()
                 else:
                     st.error("Employee ID already exists!")
@@ -238,33 +444,23 @@ def employee_management():
     
     with col2:
         st.subheader("Current Employees")
-        employees = db_manager.get_all_employees()
+        df = _employees_df(db_manager, db_manager.version)
         
-        if employees:
-            emp_data = []
-            for emp in employees:
-                emp_data.append({
-                    "Employee ID": emp['emp_id'],
-                    "Current Workload (hrs)": f"{emp['current_workload']:.1f}/9",
-                    "Available Hours": f"{emp['available_hours']:.1f}",
-                    "Status": "Available" if emp['is_available'] else "Fully Loaded"
-                })
-            
-            df = pd.DataFrame(emp_data)
+        if not df.empty:
             st.dataframe(df, use_container_width=True)
             
             # Remove employee option
             st.subheader("Remove Employee")
-            emp_ids = [emp['emp_id'] for emp in employees]
+            emp_ids = df["Employee ID"].tolist()
             emp_to_remove = st.selectbox("Select employee to remove", emp_ids)
             if st.button("Remove Employee", type="secondary"):
                 db_manager.remove_employee(emp_to_remove)
-                st.success(f"Employee {emp_to_remove} removed!")
+                st.session_state.flash = f"Employee {emp_to_remove} removed!"
                 st.rerun()
         else:
             st.info("No employees added yet. Add some employees to get started!")
 
-def task_management():
+def task_management(db_manager: DatabaseManager):
     st.header("📋 Task Management")
     
     col1, col2 = st.columns([1, 2])
@@ -276,56 +472,69 @@ def task_management():
         
         if st.button("Add Task", type="primary"):
             if task_desc and task_duration > 0:
-                employees = db_manager.get_all_employees()
-                if employees:
-                    # Auto-assign task
-                    scheduler = TaskScheduler(db_manager)
-                    best_emp = scheduler.find_best_employee(task_duration)
-                    
-                    if best_emp:
-                        # Generate task ID
-                        existing_tasks = db_manager.get_all_tasks()
-                        task_id = f"TASK_{len(existing_tasks) + 1:03d}"
-                        
-                        db_manager.add_task(task_id, task_desc, task_duration, best_emp)
-                        st.success(f"Task {task_id} assigned to {best_emp}!")
-                        st.rerun()
-                    else:
-                        st.error("No employees available!")
+                # Auto-assign task
+                scheduler = get_scheduler(db_manager)
+                best_emp = scheduler.find_best_employee(task_duration)
+                
+                if best_emp:
+                    task_id, workload = db_manager.add_task(task_desc, task_duration, best_emp)
+                    st.session_state.flash = f"Task {task_id} assigned to {best_emp} ({workload:.1f}/{WORKDAY_HOURS} hrs)!"
+                    st.rerun()
                 else:
                     st.error("Please add employees first!")
             else:
                 st.error("Please fill in all fields!")
+        
+        st.subheader("Bulk Upload")
+        uploaded = st.file_uploader("Tasks CSV with description and duration columns", type="csv")
+        if uploaded is not None and st.button("Add Tasks from CSV"):
+            try:
+                upload = pd.read_csv(uploaded)
+            except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError):
+                st.error("Could not read CSV!")
+            else:
+                if not {'description', 'duration'} <= set(upload.columns):
+                    st.error("CSV must have description and duration columns!")
+                else:
+                    # Same limits as the single-task form above
+                    upload['duration'] = pd.to_numeric(upload['duration'], errors='coerce')
+                    upload = upload.dropna(subset=['description', 'duration']).assign(
+                        description=lambda df: df['description'].astype(str)
+                    )
+                    upload = upload[
+                        upload['duration'].between(0.1, 24.0)
+                        & (upload['description'].str.strip() != "")
+                    ]
+                    descriptions = upload['description'].tolist()
+                    durations = upload['duration'].astype(float).tolist()
+                
+                    scheduler = get_scheduler(db_manager)
+                    plan = scheduler.plan_assignments(durations)
+                
+                    if not descriptions:
+                        st.error("No valid tasks found in CSV!")
+                    elif plan:
+                        db_manager.add_tasks_bulk(list(zip(descriptions, durations, plan)))
+                        st.session_state.flash = f"{len(plan)} tasks assigned!"
+                        st.rerun()
+                    else:
+                        st.error("Please add employees first!")
     
     with col2:
         st.subheader("All Tasks")
-        tasks = db_manager.get_all_tasks()
+        df = _tasks_df(db_manager, db_manager.version)
         
-        if tasks:
-            task_data = []
-            for task in tasks:
-                desc = task['description']
-                short_desc = desc[:50] + "..." if len(desc) > 50 else desc
-                task_data.append({
-                    "Task ID": task['task_id'],
-                    "Description": short_desc,
-                    "Duration (hrs)": task['duration'],
-                    "Assigned To": task['assigned_to'],
-                    "Created": task['created_at'][:16]  # Remove seconds
-                })
-            
-            df = pd.DataFrame(task_data)
+        if not df.empty:
             st.dataframe(df, use_container_width=True)
         else:
             st.info("No tasks added yet.")
 
-def dashboard():
+def dashboard(db_manager: DatabaseManager):
     st.header("📊 Dashboard")
     
-    employees = db_manager.get_all_employees()
-    tasks = db_manager.get_all_tasks()
+    total_emp, total_tasks, available_emp, total_hours = _cached_metrics(db_manager, db_manager.version)
     
-    if not employees:
+    if not total_emp:
         st.info("Add employees and tasks to see the dashboard.")
         return
     
@@ -333,17 +542,15 @@ def dashboard():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Employees", len(employees))
+        st.metric("Total Employees", total_emp)
     
     with col2:
-        st.metric("Total Tasks", len(tasks))
+        st.metric("Total Tasks", total_tasks)
     
     with col3:
-        available_emp = sum(1 for emp in employees if emp['is_available'])
         st.metric("Available Employees", available_emp)
     
     with col4:
-        total_hours = sum(task['duration'] for task in tasks)
         st.metric("Total Task Hours", f"{total_hours:.1f}")
     
     st.markdown("---")
@@ -353,30 +560,24 @@ def dashboard():
     
     with col1:
         st.subheader("Employee Workload Distribution")
-        if employees:
-            emp_workload = []
-            for emp in employees:
-                emp_workload.append({
-                    "Employee": emp['emp_id'],
-                    "Workload": emp['current_workload'],
-                    "Available": emp['available_hours']
-                })
-            
-            df = pd.DataFrame(emp_workload)
-            st.bar_chart(df.set_index("Employee")[["Workload", "Available"]])
+        employees = _cached_employees(db_manager, db_manager.version)
+        df = employees.rename(columns={
+            'emp_id': "Employee",
+            'current_workload': "Workload",
+            'available_hours': "Available"
+        })
+        st.bar_chart(df.set_index("Employee")[["Workload", "Available"]])
     
     with col2:
         st.subheader("Task Distribution")
-        assignments = db_manager.get_task_assignments()
-        if assignments:
-            task_dist = {emp_id: len(tasks) for emp_id, tasks in assignments.items() if tasks}
-            if task_dist:
-                st.bar_chart(task_dist)
+        task_dist = _cached_task_counts(db_manager, db_manager.version)
+        if task_dist:
+            st.bar_chart(task_dist)
 
-def task_assignments():
+def task_assignments(db_manager: DatabaseManager):
     st.header("📝 Task Assignments")
     
-    assignments = db_manager.get_task_assignments()
+    assignments = _cached_assignments(db_manager, db_manager.version)
     
     if not any(tasks for tasks in assignments.values()):
         st.info("No task assignments yet. Add some tasks to see assignments.")
@@ -394,10 +595,19 @@ def task_assignments():
     # Reset functionality
     st.markdown("---")
     st.subheader("⚠️ Danger Zone")
+    # A nested button would reset on the rerun its own click triggers, so the
+    # pending confirmation is kept in session state instead
     if st.button("🔄 Reset All Data", type="secondary"):
+        st.session_state.confirm_reset = True
+    
+    if st.session_state.get("confirm_reset"):
         if st.button("⚠️ Confirm Reset - This will delete everything!", type="secondary"):
             db_manager.reset_all_data()
-            st.success("All data has been reset!")
+            st.session_state.confirm_reset = False
+            st.session_state.flash = "All data has been reset!"
+            st.rerun()
+        if st.button("Cancel"):
+            st.session_state.confirm_reset = False
             st.rerun()
 
 if __name__ == "__main__":